@@ -28,6 +28,8 @@ GiB = 1024 ** 3  # pylint: disable=invalid-name
 
 # Main
 ALERTS_CHANNEL_FORMAT_DEFAULT: Final = "##{nick}-alerts"
+BLOOM_FILTER_ERROR_RATE: Final = 0.001
+BLOOM_FILTER_INITIAL_CAPACITY: Final = 200_000
 CACHE_MAXSIZE__BITLY_SHORTENER: Final = CACHE_MAXSIZE_DEFAULT
 CACHE_MAXSIZE__INT8HASH: Final = CACHE_MAXSIZE_DEFAULT
 CACHE_MAXSIZE__URL_COMPRESSION: Final = 4
@@ -60,6 +62,7 @@ ETAG_CACHE_PROHIBITED_NETLOCS: Final = {
 }
 ETAG_TEST_PROBABILITY: Final = 0.1
 FEED_DEFAULTS: Final = {"new": "some", "shorten": True}
+FEED_ENTRIES_MAX: Final = 1000  # Safety bound for pathologically large feeds. A feed can set a lower bound via its `max` option.
 IRC_COLORS: Final = set(ircstyle.colors.idToName.values())
 MIN_CHANNEL_IDLE_TIME_DEFAULT: Final = {"dev": 1}.get(ENV, 15 * 60)
 MIN_CONSECUTIVE_FEED_FAILURES_FOR_ALERT: Final = 3
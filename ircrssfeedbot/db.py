@@ -1,9 +1,10 @@
 """Database interface."""
 import logging
 import threading
-from typing import List, Set
+from typing import List, Set, Tuple
 
 import peewee
+import pybloom_live
 from peewee import chunked
 
 from . import config
@@ -42,6 +43,7 @@ class Database:
         self._db = _DATABASE
         self._db.create_tables([Post])
         self._write_lock = threading.Lock()  # Unclear if necessary, but used anyway for safety.
+        self._posted_feeds: Set[Tuple[int, int]] = set()  # Caches (channel, feed) hashes known to have posts.
         log.info("Initialized database having path %s.", db_path)
 
         # Vacuum db
@@ -57,30 +59,53 @@ class Database:
         self._db.execute_sql("ANALYZE;")
         log.info("Analyzed database.")
 
+        # Populate bloom filter
+        log.debug("Populating bloom filter with posted URLs.")
+        self._bloom_lock = threading.Lock()
+        self._posted_bloom = pybloom_live.ScalableBloomFilter(initial_capacity=config.BLOOM_FILTER_INITIAL_CAPACITY, error_rate=config.BLOOM_FILTER_ERROR_RATE)
+        num_posts = 0
+        for channel_url_hashes in Post.select(Post.channel, Post.url).tuples().iterator():
+            self._posted_bloom.add(channel_url_hashes)
+            num_posts += 1
+        log.info("Populated bloom filter with %s posted URLs.", num_posts)
+
         # Helper function:
         # sql = lambda *s: list(self._db.execute_sql(*s))
 
-    @staticmethod
-    def _select_unposted(conditions: peewee.Expression, urls: List[str]) -> List[str]:
+    def _select_unposted(self, channel_hash: int, conditions: peewee.Expression, urls: List[str]) -> List[str]:
         hashes2urls = Int8Hash.as_dict(urls)
+        # Skip querying URLs which the bloom filter attests were never posted in the channel.
+        # Note: A URL unposted in the channel is necessarily also unposted for each feed of the channel.
+        with self._bloom_lock:
+            maybe_posted_hashes = [url_hash for url_hash in hashes2urls if (channel_hash, url_hash) in self._posted_bloom]
         posted_hashes: Set[int] = set()
-        for hashes_batch in chunked(hashes2urls, 100):  # Ref: https://www.sqlite.org/limits.html#max_variable_number
+        for hashes_batch in chunked(maybe_posted_hashes, 100):  # Ref: https://www.sqlite.org/limits.html#max_variable_number
             conditions_batch = conditions & Post.url.in_(hashes_batch)
             posted_hashes |= {post[0] for post in Post.select(Post.url).where(conditions_batch).tuples().iterator()}
         unposted_urls = [url for url_hash, url in hashes2urls.items() if url_hash not in posted_hashes]
         return unposted_urls
 
-    @staticmethod
-    def is_new_feed(channel: str, feed: str) -> bool:
-        """Return whether the specified feed name is new or not by checking whether it has entries in the database."""
-        conditions = (Post.channel == Int8Hash.as_int(channel)) & (Post.feed == Int8Hash.as_int(feed))
-        return not Post.select(Post.url).where(conditions).limit(1)
+    def is_new_feed(self, channel: str, feed: str) -> bool:
+        """Return whether the specified feed name is new or not by checking whether it has entries in the database.
+
+        Since a feed with entries can never become new again, the check is cached for it, thereby skipping the
+        repeated database query on each of its subsequent reads.
+        """
+        channel_feed_hashes = (Int8Hash.as_int(channel), Int8Hash.as_int(feed))
+        if channel_feed_hashes in self._posted_feeds:
+            return False
+        conditions = (Post.channel == channel_feed_hashes[0]) & (Post.feed == channel_feed_hashes[1])
+        if Post.select(Post.url).where(conditions).limit(1):
+            self._posted_feeds.add(channel_feed_hashes)
+            return False
+        return True
 
     def select_unposted_for_channel(self, channel: str, feed: str, urls: List[str]) -> List[str]:
         """Return unposted URLs for the given channel."""
         log.debug("Retrieving unposted URLs from the database for channel %s having ignored feed %s out of %s URLs.", channel, feed, len(urls))
-        conditions = Post.channel == Int8Hash.as_int(channel)
-        unposted_urls = self._select_unposted(conditions, urls)
+        channel_hash = Int8Hash.as_int(channel)
+        conditions = Post.channel == channel_hash
+        unposted_urls = self._select_unposted(channel_hash, conditions, urls)
         loglevel = logging.INFO if len(unposted_urls) > 0 else logging.DEBUG
         log.log(loglevel, "Returning %s unposted URLs from the database for channel %s having ignored feed %s out of %s URLs.", len(unposted_urls), channel, feed, len(urls))
         return unposted_urls
@@ -88,8 +113,9 @@ class Database:
     def select_unposted_for_channel_feed(self, channel: str, feed: str, urls: List[str]) -> List[str]:
         """Return unposted URLs for the given channel and feed."""
         log.debug("Retrieving unposted URLs from the database for channel %s having feed %s out of %s URLs.", channel, feed, len(urls))
-        conditions = (Post.channel == Int8Hash.as_int(channel)) & (Post.feed == Int8Hash.as_int(feed))
-        unposted_urls = self._select_unposted(conditions, urls)
+        channel_hash = Int8Hash.as_int(channel)
+        conditions = (Post.channel == channel_hash) & (Post.feed == Int8Hash.as_int(feed))
+        unposted_urls = self._select_unposted(channel_hash, conditions, urls)
         loglevel = logging.INFO if len(unposted_urls) > 0 else logging.DEBUG
         log.log(loglevel, "Returning %s unposted URLs from the database for channel %s having feed %s out of %s URLs.", len(unposted_urls), channel, feed, len(urls))
         return unposted_urls
@@ -98,10 +124,17 @@ class Database:
         """Insert the given URLs for the given channel and feed."""
         log.debug("Inserting %s URLs into the database for channel %s having feed %s.", len(urls), channel, feed)
         channel_hash, feed_hash, urls_hashes = Int8Hash.as_int(channel), Int8Hash.as_int(feed), Int8Hash.as_list(urls)
+        # Note: The bloom filter is updated before the database such that a concurrent reader can never observe a
+        # definitely-unposted URL which is in fact posted. A spurious bloom entry is harmless; it is checked in the database.
+        with self._bloom_lock:
+            for url_hash in urls_hashes:
+                self._posted_bloom.add((channel_hash, url_hash))
         data = ({"channel": channel_hash, "feed": feed_hash, "url": url_hash} for url_hash in urls_hashes)
         with self._write_lock, self._db.atomic():
             for batch in chunked(data, 100):  # Ref: https://www.sqlite.org/limits.html#max_variable_number
                 Post.insert_many(batch).execute()  # pylint: disable=no-value-for-parameter
                 # Note: "sqlite3.IntegrityError: UNIQUE constraint failed" would be indicative of a bug elsewhere.
                 # As such, prepending ".on_conflict_ignore()" before ".execute()" should not be needed.
+        if urls:
+            self._posted_feeds.add((channel_hash, feed_hash))
         log.info("Inserted %s URLs into the database for channel %s having feed %s.", len(urls), channel, feed)
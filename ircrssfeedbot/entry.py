@@ -4,6 +4,11 @@ import logging
 import re
 from typing import Any, Dict, List, Optional, Pattern, Tuple
 
+try:
+    import re2 as _re  # Compiles searchlist patterns with linear-time matching. Ref: https://pypi.org/project/google-re2/
+except ImportError:
+    _re = re  # type: ignore
+
 from . import config
 from .style import style
 from .util.list import ensure_list
@@ -44,6 +49,83 @@ class RawFeedEntry(dict):
         return [c.strip() for c in ensure_list(self.get("category"))]
 
 
+@dataclasses.dataclass
+class SearchPatterns:
+    """Compiled regular expression patterns of a single searchlist key.
+
+    If every individual pattern compiled using `re2`, the patterns are additionally combined into a single
+    alternation pattern such that a search requires a single scan of the searched value instead of a scan per
+    pattern. Combining is unsafe for patterns which fell back to `re`, as the backreference and scoped-flag
+    constructs which `re2` rejects change meaning inside an alternation, e.g. a numbered backreference pointing
+    into another pattern's group, or an inline flag leaking onto the other patterns.
+    """
+
+    patterns: List[Pattern]
+
+    def __post_init__(self):
+        self.combined: Optional[Pattern] = None
+        self.groups: Dict[str, Pattern] = {}
+        if (len(self.patterns) > 1) and (_re is not re) and not any(isinstance(pattern, re.Pattern) for pattern in self.patterns):
+            groups = {f"sl{index}": pattern for index, pattern in enumerate(self.patterns)}
+            try:
+                self.combined = _re.compile("|".join(f"(?P<{name}>{pattern.pattern})" for name, pattern in groups.items()))
+            except _re.error:  # e.g. due to a group name used in multiple patterns.
+                log.debug("Unable to combine %s patterns into a single pattern. They will be searched individually.", len(self.patterns))
+            else:
+                self.groups = groups
+
+    def __bool__(self) -> bool:
+        return bool(self.patterns)
+
+    @staticmethod
+    def compile(pattern: str) -> Pattern:  # pylint: disable=redefined-builtin
+        """Return the given searchlist pattern compiled using `re2` if available and supported, otherwise using `re`.
+
+        Unlike `re`, which can backtrack catastrophically on an adversarial pattern, `re2` guarantees linear-time
+        matching of the user-supplied searchlist patterns.
+        """
+        if _re is re:
+            return re.compile(pattern)
+        try:
+            return _re.compile(pattern)
+        except _re.error:  # e.g. due to a lookaround or backreference which re2 does not support.
+            return re.compile(pattern)
+
+    def search(self, value: str) -> Optional[Pattern]:
+        """Return the matching pattern for the given value, if any."""
+        if combined := self.combined:
+            if match := combined.search(value):
+                for name, pattern in self.groups.items():
+                    if match.group(name) is not None:
+                        return pattern
+            return None
+        for pattern in self.patterns:
+            if pattern.search(value):
+                return pattern
+        return None
+
+
+def _add_slots(cls: type) -> type:
+    """Return a reconstructed copy of the given dataclass that stores its fields in slots.
+
+    Slots halve the per-instance memory use, which is relevant because feeds can hold hundreds of entries.
+    This helper is usable until Python 3.10, which adds native support via `slots=True`.
+    """
+    # Ref: https://github.com/ericvsmith/dataclasses/blob/master/dataclass_tools.py
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in dataclasses.fields(cls))
+    cls_dict["__slots__"] = field_names
+    for field_name in field_names:
+        cls_dict.pop(field_name, None)  # Removes class variables which would otherwise conflict with the slots.
+    cls_dict.pop("__dict__", None)
+    qualname = getattr(cls, "__qualname__", None)
+    cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    if qualname is not None:
+        cls.__qualname__ = qualname
+    return cls
+
+
+@_add_slots
 @dataclasses.dataclass(unsafe_hash=True)
 class FeedEntry:
     """Feed entry."""
@@ -54,24 +136,28 @@ class FeedEntry:
     categories: List[str] = dataclasses.field(compare=False, repr=True)
     data: Dict[str, Any] = dataclasses.field(compare=False, repr=False)
     feed_reader: Any = dataclasses.field(compare=False, repr=False)
+    short_url: Optional[str] = dataclasses.field(default=None, compare=False, repr=False)
+    matching_title_search_pattern: Optional[Pattern] = dataclasses.field(default=None, compare=False, repr=False)
 
-    def __post_init__(self):
-        self.short_url: Optional[str] = None
-        self.matching_title_search_pattern: Optional[Pattern] = None
-
-    def _matching_pattern(self, patterns: Dict[str, List[Pattern]]) -> Optional[Tuple[str, Pattern]]:
-        """Return the matching key name and regular expression pattern, if any."""
-        # Check title and long URL
-        for search_key, val in {"title": self.title, "url": self.long_url}.items():
-            for pattern in patterns[search_key]:
-                if pattern.search(val):
-                    log.log(5, "%s matches %s pattern %s.", self, search_key, repr(pattern.pattern))
-                    return search_key, pattern
+    def _matching_pattern(self, patterns: Dict[str, SearchPatterns]) -> Optional[Tuple[str, Pattern]]:
+        """Return the matching key name and regular expression pattern, if any.
+
+        Keys without patterns are skipped.
+        """
+        # Check title
+        if (title_patterns := patterns["title"]) and (pattern := title_patterns.search(self.title)):
+            log.log(5, "%s matches title pattern %s.", self, repr(pattern.pattern))
+            return "title", pattern
+
+        # Check long URL
+        if (url_patterns := patterns["url"]) and (pattern := url_patterns.search(self.long_url)):
+            log.log(5, "%s matches url pattern %s.", self, repr(pattern.pattern))
+            return "url", pattern
 
         # Check categories
-        for pattern in patterns["category"]:
-            for category in self.categories:  # This loop is only for categories.
-                if pattern.search(category):
+        if category_patterns := patterns["category"]:  # Skips the categories construction if there are no patterns for it.
+            for category in self.categories:
+                if pattern := category_patterns.search(category):
                     log.log(5, "%s having category %s matches category pattern %s.", self, repr(category), repr(pattern.pattern))
                     return "category", pattern
 
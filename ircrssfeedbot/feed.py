@@ -9,7 +9,7 @@ import re
 import time
 import types
 from functools import cached_property, lru_cache
-from typing import Callable, Dict, List, Optional, Pattern, Tuple
+from typing import Dict, List, Optional, Pattern, Tuple
 
 import bitlyshortener
 import miniirc
@@ -17,7 +17,7 @@ from orderedset import OrderedSet
 
 from . import config
 from .db import Database
-from .entry import FeedEntry, RawFeedEntry
+from .entry import FeedEntry, RawFeedEntry, SearchPatterns
 from .url import URLReader
 from .util.bs4 import html_to_text
 from .util.dict import dict_str
@@ -45,13 +45,13 @@ def _parse_entries(parser_name: str, selector: Optional[str], follower: Optional
 
 
 @lru_cache(maxsize=None)  # maxsize is bounded by a multiple of the number of feeds.
-def _patterns(channel: str, feed: str, list_type: str) -> Dict[str, List[Pattern]]:  # Cache-lookup friendly signature.
-    """Return a mapping of keys to a list of unique compiled regular expression patterns for the given args.
+def _patterns(channel: str, feed: str, list_type: str) -> Dict[str, SearchPatterns]:  # Cache-lookup friendly signature.
+    """Return a mapping of keys to the unique compiled regular expression patterns for the given args.
 
     The mapping keys are `title`, `url`, and `category`.
     """
     list_config = config.INSTANCE["feeds"][channel][feed].get(list_type) or {}
-    patterns = {key: [re.compile(pat) for pat in leaves(list_config.get(key))] for key in ("title", "url", "category")}
+    patterns = {key: SearchPatterns([SearchPatterns.compile(pat) for pat in leaves(list_config.get(key))]) for key in ("title", "url", "category")}
     log.debug("Caching regex patterns for %s of feed %s of %s.", list_type, feed, channel)
     return patterns
 
@@ -75,6 +75,10 @@ class FeedReader:
         self.min_channel_idle_time = config.MIN_CHANNEL_IDLE_TIME_DEFAULT if (self.config.get("period", config.PERIOD_HOURS_DEFAULT) > config.PERIOD_HOURS_MIN) else 0
         self.blacklist = _patterns(self.channel, self.name, "blacklist")
         self.whitelist = _patterns(self.channel, self.name, "whitelist")
+        self.sub_patterns: Dict[str, Tuple[Pattern, str]] = {
+            sub_attr: (re.compile(sub_attr_config["pattern"]), sub_attr_config["repl"]) for sub_attr, sub_attr_config in (self.config.get("sub") or {}).items() if sub_attr_config
+        }
+        self.format_patterns: Dict[str, Pattern] = {re_key: re.compile(re_val) for re_key, re_val in ((self.config.get("format") or {}).get("re") or {}).items()}
         self.max_posts_if_new = config.NEW_FEED_POSTS_MAX[self.config["new"]]
         self.mirror = self.config.get("mirror") in (None, True)
 
@@ -104,7 +108,12 @@ class FeedReader:
         # e.g. for https://projecteuclid.org/feeds/euclid.ba_rss.xml
         action = f"After {after_what}, removing" if after_what else "Removing"
         log.debug("%s duplicate entry URLs for %s.", action, self)
-        entries_deduped = list(dict.fromkeys(entries))
+        seen_long_urls = set()
+        entries_deduped = []
+        for entry in entries:
+            if (long_url := entry.long_url) not in seen_long_urls:  # Hashes the URL string directly, skipping a FeedEntry.__hash__ dispatch per entry.
+                seen_long_urls.add(long_url)
+                entries_deduped.append(entry)
         num_removed = len(entries) - len(entries_deduped)
         action = f"After {after_what}, removed" if after_what else "Removed"
         log.debug("%s %s duplicate entry URLs out of %s, leaving %s, for %s.", action, num_removed, len(entries), len(entries_deduped), self)
@@ -153,8 +162,9 @@ class FeedReader:
         if feed_config.get("https"):
             log.debug("Enforcing HTTPS for URLs in %s.", self)
             for entry in entries:
-                if entry.long_url.startswith("http://"):
-                    entry.long_url = entry.long_url.replace("http://", "https://", 1)
+                long_url = entry.long_url
+                if long_url[:7] == "http://":  # A slice comparison is faster here than startswith.
+                    entry.long_url = "https:" + long_url[5:]  # Skips the prefix scan that replace performs.
             log.debug("Enforced HTTPS for URLs in %s.", self)
 
         # Remove WWW from URLs
@@ -176,22 +186,24 @@ class FeedReader:
             log.debug("Removed emojis for titles in %s.", self)
 
         # Substitute entries
-        if sub_config := feed_config.get("sub"):
+        if sub_patterns := self.sub_patterns:
             log.debug("Substituting entries for %s.", self)
-            re_sub: Callable[[Dict[str, str], str], str] = lambda r, v: re.sub(r["pattern"], r["repl"], v)
             for sub_attr, entry_attr in {"title": "title", "url": "long_url", "summary": "summary"}.items():
-                if sub_attr_config := sub_config.get(sub_attr):
+                if sub_pattern_repl := sub_patterns.get(sub_attr):
+                    sub_pattern, sub_repl = sub_pattern_repl
                     for entry in entries:
                         if entry_attr_val_old := getattr(entry, entry_attr):
-                            entry_attr_val_new = re_sub(sub_attr_config, entry_attr_val_old)
-                            setattr(entry, entry_attr, entry_attr_val_new)
+                            setattr(entry, entry_attr, sub_pattern.sub(sub_repl, entry_attr_val_old))
             log.debug("Substituted entries for %s.", self)
 
         # Format entries
         if format_config := feed_config.get("format"):
             log.debug("Formatting entries for %s.", self)
-            format_re = format_config.get("re") or {}
+            format_re = self.format_patterns  # Compiled once at reader initialization.
             format_str = format_config.get("str") or {}
+            title_format_str = format_str.get("title", "{title}")
+            url_format_str = format_str.get("url", "{url}")
+            format_title, format_url = title_format_str.format_map, url_format_str.format_map  # Bound once, not once per entry.
             feed_params = types.SimpleNamespace(url=feed_config["url"])
             for entry in entries:
                 # Collect:
@@ -203,19 +215,17 @@ class FeedReader:
                     "categories": entry.categories,
                     "feed": feed_params,
                 }
-                for re_key, re_val in format_re.items():
-                    if match := re.search(re_val, params[re_key]):
+                for re_key, re_pattern in format_re.items():
+                    if match := re_pattern.search(params[re_key]):
                         params.update(match.groupdict())
                 # Format title:
-                title_format_str = format_str.get("title", "{title}")
                 try:
-                    entry.title = title_format_str.format_map(params)
+                    entry.title = format_title(params)
                 except Exception as exc:  # pylint: disable=broad-except
                     log.warning(f"Unable to format entry title for {entry} by {self} due to exception {exc!r} using format string {title_format_str!r}.")
                 # Format URL:
-                url_format_str = format_str.get("url", "{url}")
                 try:
-                    entry.long_url = url_format_str.format_map(params)
+                    entry.long_url = format_url(params)
                 except Exception as exc:  # pylint: disable=broad-except
                     log.warning(f"Unable to format entry URL for {entry} by {self} due to exception {exc!r} using format string {url_format_str!r}.")
             log.debug("Formatted entries for %s.", self)
@@ -277,11 +287,15 @@ class FeedReader:
     def _parse_entries(self, url_content: bytes) -> Tuple[List[FeedEntry], List[str]]:
         # Note: Using a separate temporary process is a workaround for memory leaks of hext, feedparser, etc.
         # with mp.Pool(1) as pool:
-        log.debug(f"Using process worker from pool to parse entries for {self} using {self.parser_name}.")
+        debug_logging = log.isEnabledFor(logging.DEBUG)  # Skips formatting the unlogged messages.
+        if debug_logging:
+            log.debug(f"Using process worker from pool to parse entries for {self} using {self.parser_name}.")
         raw_entries, urls = self.worker_pool.apply(_parse_entries, (self.parser_name, self.parser_selector, self.parser_follower, url_content))
-        log.debug(f"Used process worker from pool to parse {len(raw_entries):,} raw entries and {len(urls):,} URLs for {self} using {self.parser_name}.")
+        if debug_logging:
+            log.debug(f"Used process worker from pool to parse {len(raw_entries):,} raw entries and {len(urls):,} URLs for {self} using {self.parser_name}.")
         entries = [FeedEntry(title=e.title, long_url=e.link, summary=e.summary, categories=e.categories, data=dict(e), feed_reader=self) for e in raw_entries]
-        log.debug(f"Converted {len(raw_entries):,} raw entries to actual entries for {self}.")
+        if debug_logging:
+            log.debug(f"Converted {len(raw_entries):,} raw entries to actual entries for {self}.")
         return entries, urls
 
     def read(self) -> "Feed":  # pylint: disable=too-many-locals,too-many-statements
@@ -330,6 +344,12 @@ class FeedReader:
                     log.debug(f"Sleeping for {sleep_time:.1f}s before next URL.")
                     time.sleep(sleep_time)
 
+        # Limit entries
+        max_entries = min(feed_config.get("max") or config.FEED_ENTRIES_MAX, config.FEED_ENTRIES_MAX)
+        if len(entries) > max_entries:
+            log.debug(f"Truncating the {len(entries):,} parsed entries to the first {max_entries:,} for {self}.")
+            del entries[max_entries:]
+
         # Log entries
         url_read_approach_desc = readable_list([f"{count} URLs {approach}" for approach, count in url_read_approach_counts.items()])
         num_before_processing = len(entries)
@@ -389,35 +409,44 @@ class Feed:
     @cached_property
     def _postable_entries(self) -> List[FeedEntry]:
         """Return the subset of postable entries."""
-        log.debug(f"Retrieving postable entries for {self}.")
+        debug_logging = log.isEnabledFor(logging.DEBUG)  # Skips formatting the unlogged messages.
+        if debug_logging:
+            log.debug(f"Retrieving postable entries for {self}.")
         unposted_entries = self._unposted_entries
 
         # Filter entries if new feed
         if self.reader.db.is_new_feed(self.channel, self.name):
-            log.debug(f"Filtering new {self} having {len(unposted_entries)} unposted entries for postable entries.")
+            if debug_logging:
+                log.debug(f"Filtering new {self} having {len(unposted_entries)} unposted entries for postable entries.")
             max_posts = self.reader.max_posts_if_new
             postable_entries = unposted_entries[:max_posts]
-            log.debug(f"Filtered new {self} from {len(unposted_entries)} unposted entries to {len(postable_entries)} postable entries given a limit of {max_posts} entries.")
+            if debug_logging:
+                log.debug(f"Filtered new {self} from {len(unposted_entries)} unposted entries to {len(postable_entries)} postable entries given a limit of {max_posts} entries.")
         else:
             postable_entries = unposted_entries
 
         # Shorten URLs
         if postable_entries and self.reader.config["shorten"]:
-            log.debug(f"Shortening {len(postable_entries)} postable long URLs for {self}.")
+            if debug_logging:
+                log.debug(f"Shortening {len(postable_entries)} postable long URLs for {self}.")
             long_urls = [entry.long_url for entry in postable_entries]
             short_urls = self.reader.url_shortener.shorten_urls(long_urls)
             for entry, short_url in zip(postable_entries, short_urls):
                 entry.short_url = short_url
-            log.debug(f"Shortened {len(postable_entries)} postable long URLs for {self}.")
+            if debug_logging:
+                log.debug(f"Shortened {len(postable_entries)} postable long URLs for {self}.")
 
-        log.debug(f"Returning {len(postable_entries)} postable entries for {self}.")
+        if debug_logging:
+            log.debug(f"Returning {len(postable_entries)} postable entries for {self}.")
         return postable_entries
 
     @cached_property
     def _unposted_entries(self) -> List[FeedEntry]:
         """Return the subset of unposted entries."""
-        log.debug(f"Retrieving unposted entries for {self}.")
+        log.debug("Retrieving unposted entries for %s.", self)
         entries = self.entries
+        if not entries:
+            return entries  # Skips the database call.
 
         long_urls = [entry.long_url for entry in entries]
         db_dedup_strategy = self.reader.config.get("dedup") or config.DEDUP_STRATEGY_DEFAULT
@@ -426,9 +455,12 @@ class Feed:
         else:
             assert db_dedup_strategy == "feed"
             unposted_long_urls = self.reader.db.select_unposted_for_channel_feed(self.channel, self.name, long_urls)
-        unique_unposted_long_urls = set(unposted_long_urls)
-        unposted_entries = [entry for entry in entries if entry.long_url in unique_unposted_long_urls]
-        log.debug(f"Returning {len(unposted_entries)} unposted entries out of {len(entries)} for {self}.")
+        unique_unposted_long_urls = frozenset(unposted_long_urls)
+        if len(unique_unposted_long_urls) == len(entries):  # The entries are already deduplicated by long URL.
+            unposted_entries = entries  # All are unposted. Skips rebuilding the list.
+        else:
+            unposted_entries = [entry for entry in entries if entry.long_url in unique_unposted_long_urls]
+        log.debug("Returning %s unposted entries out of %s for %s.", len(unposted_entries), len(entries), self)
         return unposted_entries
 
     @cached_property
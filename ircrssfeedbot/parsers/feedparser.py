@@ -1,14 +1,39 @@
 """Parse entries using `feedparser`."""
 import dataclasses
-from typing import List
+import io
+import logging
+from typing import Any, Dict, List
 
 import feedparser
+import lxml.etree
 
+from .. import config
 from ..entry import RawFeedEntry as BaseRawFeedEntry
 from ..gnews import decode_google_news_url
 from ..util.lxml import sanitize_xml
 from ._base import BaseParser
 
+log = logging.getLogger(__name__)
+
+_CORE_NAMESPACES = frozenset(
+    (
+        None,  # RSS 2.0
+        "http://purl.org/rss/1.0/",  # RSS 1.0
+        "http://www.w3.org/1999/02/22-rdf-syntax-ns#",  # RDF
+        "http://purl.org/atom/ns#",  # Atom 0.3
+        "http://www.w3.org/2005/Atom",  # Atom 1.0
+    )
+)
+_CORE_FIELD_NAMES = frozenset(("link", "title", "description", "summary", "category"))
+_DATA_KEY_NAMES = {  # Maps remaining child names to the entry key names used by feedparser, for compatibility with the format option.
+    "creator": "author",
+    "date": "updated",
+    "guid": "id",
+    "issued": "published",
+    "modified": "updated",
+    "pubDate": "published",
+}
+
 
 class RawFeedEntry(BaseRawFeedEntry):
     """Raw feed entry."""
@@ -27,6 +52,62 @@ class RawFeedEntry(BaseRawFeedEntry):
         return [term for tag in self.get("tags", []) if (term := (tag["term"] or "").strip())]  # tag["term"] is None in https://www.sciencemag.org/rss/news_current.xml
 
 
+def _fast_parse(content: bytes) -> List[RawFeedEntry]:
+    """Return a list of parsed raw entries using a streaming parser, or an empty list if the content is unsuitable.
+
+    This skips the relatively expensive `feedparser` machinery, notably its relative URI resolution and HTML
+    sanitization, neither of which is needed for the few entry fields that are used.
+    An empty list is returned if any parsed entry lacks a link, in which case `feedparser` is to be used instead.
+
+    `lxml.etree.XMLSyntaxError` is raised if the content is not well-formed XML.
+    """
+    entries = []
+    for _event, element in lxml.etree.iterparse(io.BytesIO(content.lstrip()), events=("end",), tag=("{*}item", "{*}entry")):
+        entry: Dict[str, Any] = {"tags": []}
+        content_text = ""
+        for child in element:
+            if not isinstance(child.tag, str):  # e.g. for a comment or processing instruction.
+                continue
+            qname = lxml.etree.QName(child)
+            name = qname.localname
+            if qname.namespace not in _CORE_NAMESPACES:
+                if name in _CORE_FIELD_NAMES:
+                    continue  # e.g. a media:title or media:description must not clobber its core counterpart.
+            elif name == "link":
+                link = (child.text or "").strip() or (child.get("href") or "").strip()  # Atom links use the href attribute.
+                if link and ("link" not in entry) and (child.get("rel") in (None, "alternate")):
+                    entry["link"] = link
+                continue
+            elif name == "title":
+                entry["title"] = "".join(child.itertext())
+                continue
+            elif name in ("description", "summary"):
+                entry.setdefault("summary", "".join(child.itertext()))
+                continue
+            elif name == "content":
+                content_text = content_text or "".join(child.itertext())  # Atom content serves as a fallback summary.
+                continue
+            elif name == "category":
+                if term := (child.text or child.get("term") or "").strip():  # Atom categories use the term attribute.
+                    entry["tags"].append({"term": term})
+                continue
+            name = _DATA_KEY_NAMES.get(name, name)
+            if (name not in entry) and child.text:
+                entry[name] = child.text  # e.g. for author, id, or published, usable by the format option.
+        if content_text:
+            entry.setdefault("summary", content_text)  # Matches feedparser, which exposes Atom content as the summary when there is no summary.
+        if "link" not in entry:
+            return []  # e.g. for a feed relying on a guid permalink, which feedparser understands.
+        entries.append(RawFeedEntry(entry))
+        # Bound memory by freeing the fully parsed element and its preceding siblings.
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+        if len(entries) >= config.FEED_ENTRIES_MAX:  # Stops parsing pathologically large feeds early.
+            break
+    return entries
+
+
 @dataclasses.dataclass
 class Parser(BaseParser):
     """Parse entries using `feedparser`."""
@@ -34,5 +115,11 @@ class Parser(BaseParser):
     @property
     def entries(self) -> List[RawFeedEntry]:
         """Return a list of parsed raw entries."""
+        try:
+            if entries := _fast_parse(self.content):
+                return entries
+            log.debug("The streaming parser found no usable entries. Falling back to feedparser.")
+        except lxml.etree.XMLSyntaxError as exc:
+            log.debug("The streaming parser failed with error: %s. Falling back to feedparser.", exc)
         content = sanitize_xml(self.content)  # e.g. for unescaped "&" char in https://deepmind.com/blog/feed/basic/
         return [RawFeedEntry(e) for e in feedparser.parse(content.lstrip())["entries"]]
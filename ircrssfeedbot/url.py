@@ -33,20 +33,21 @@ def _decompress(content: bytes) -> bytes:
 class URLContent:
     """URL content."""
 
-    CURRENT_VERSION = 1
+    CURRENT_VERSION = 2
 
     class Approach:
         """Approaches for providing the content of a URL."""
 
         CACHE_HIT = "read from unexpired cache"
-        CACHE_ETAG_HIT = "read from cache having matching etag"
+        CACHE_CONDITIONAL_HIT = "read from cache via conditional request"
         READ = "read bypassing cache"
 
-    def __init__(self, content: bytes, etag: Optional[str], approach: str):
+    def __init__(self, content: bytes, etag: Optional[str], last_modified: Optional[str], approach: str):
         self.time = time.time()
         self.version = self.CURRENT_VERSION
         self._content = _compress(content)
         self.etag = etag
+        self.last_modified = last_modified
         self.approach = approach
 
     @property
@@ -108,6 +109,12 @@ class URLReader:
 
     _CACHE = diskcache.Cache(directory=config.DISKCACHE_PATH / "URLReader", timeout=2, size_limit=config.DISKCACHE_SIZE_LIMIT)
 
+    # Note: A shared session reuses pooled connections across reader threads, avoiding a TCP+TLS handshake per request.
+    # It may also be relevant for reading a page which requires cookies to be accepted.
+    _SESSION = requests.Session()
+    _SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32))
+    _SESSION.mount("http://", requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
     def __init__(self, max_cache_age: float):
         self._max_cache_age = max_cache_age
 
@@ -164,6 +171,9 @@ class URLReader:
             elif is_etag_cache_allowed:
                 request_headers["If-None-Match"] = cached_url_content.etag
                 log.debug(f"Added request header If-None-Match={request_headers['If-None-Match']} for {url}.")
+        if cached_url_content and cached_url_content.last_modified and is_etag_cache_allowed and (not test_cached_etag):
+            request_headers["If-Modified-Since"] = cached_url_content.last_modified
+            log.debug(f"Added request header If-Modified-Since={request_headers['If-Modified-Since']} for {url}.")
 
         # Request URL
         log.debug(f"Resiliently retrieving content for {url} using user agent {request_headers['User-Agent']!r}.")
@@ -171,8 +181,7 @@ class URLReader:
         timer = Timer()
         for num_attempt in range(1, config.READ_ATTEMPTS_MAX + 1):
             try:
-                response = requests.Session().get(url, timeout=config.REQUEST_TIMEOUT, headers=request_headers)
-                # Note: requests.Session may be relevant for reading a page which requires cookies to be accepted.
+                response = self._SESSION.get(url, timeout=config.REQUEST_TIMEOUT, headers=request_headers)
                 response.raise_for_status()
             except requests.RequestException as exc:
                 log.info(f"Error reading {url} in attempt {num_attempt} of {config.READ_ATTEMPTS_MAX}: {exc}")
@@ -183,19 +192,22 @@ class URLReader:
                 log.debug(f"Received response having status code {response.status_code} in attempt {num_attempt} for {url} in {timer}.")
                 break
 
-        # Reuse ETag cache if possible
+        # Reuse conditional cache if possible
         if response.status_code == 304:  # pylint: disable=too-many-nested-blocks
             # Note: 304 = Not Modified.
-            assert all((cached_url_content, has_cached_etag, not test_cached_etag, request_headers["If-None-Match"]))
+            assert cached_url_content and (not test_cached_etag)
+            assert ("If-None-Match" in request_headers) or ("If-Modified-Since" in request_headers)
             url_content = URLContent(  # Sets updated time attribute too.
-                content=cached_url_content.content, etag=cached_url_content.etag, approach=URLContent.Approach.CACHE_ETAG_HIT
+                content=cached_url_content.content, etag=cached_url_content.etag, last_modified=cached_url_content.last_modified, approach=URLContent.Approach.CACHE_CONDITIONAL_HIT
             )
-            log.debug(f"Returning unchanged ETag matched URL content from cache for {url}.")
+            log.debug(f"Returning unchanged conditionally matched URL content from cache for {url}.")
             self._CACHE[url] = url_content
             return url_content
 
         # Cache content
-        url_content = URLContent(content=response.content, etag=response.headers.get("ETag"), approach=URLContent.Approach.READ)
+        url_content = URLContent(
+            content=response.content, etag=response.headers.get("ETag"), last_modified=response.headers.get("Last-Modified"), approach=URLContent.Approach.READ
+        )
         self._CACHE[url] = url_content
         log.debug(f"Cached URL content of size {humanize_size(url_content.content)} for {url}.")
 